@@ -7,6 +7,7 @@ __all__ = []
 
 from plasmapy.particles.atomic import (
     atomic_number,
+    atomic_number_array,
     charge_number,
     common_isotopes,
     electric_charge,
@@ -16,10 +17,12 @@ from plasmapy.particles.atomic import (
     isotopic_abundance,
     known_isotopes,
     mass_number,
+    mass_number_array,
     particle_mass,
     reduced_mass,
     stable_isotopes,
     standard_atomic_weight,
+    standard_atomic_weight_array,
 )
 from plasmapy.particles.decorators import particle_input
 from plasmapy.particles.ionization_state import IonicLevel, IonizationState
@@ -2,8 +2,11 @@
 
 __all__ = [
     "atomic_number",
+    "atomic_number_array",
     "mass_number",
+    "mass_number_array",
     "standard_atomic_weight",
+    "standard_atomic_weight_array",
     "particle_mass",
     "isotopic_abundance",
     "charge_number",
@@ -19,16 +22,31 @@ __all__ = [
     "periodic_table_group",
     "periodic_table_block",
     "periodic_table_category",
+    "periodic_table_info",
+    "periodic_table_period_array",
+    "periodic_table_group_array",
+    "periodic_table_block_array",
+    "periodic_table_category_array",
 ]
 
 import astropy.constants as const
 import astropy.units as u
+import numpy as np
 
+from functools import lru_cache, wraps
 from numbers import Integral, Real
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from plasmapy.particles.decorators import particle_input
-from plasmapy.particles.elements import _elements
+from plasmapy.particles.elements import (
+    _atomic_numbers_to_symbols,
+    _elements,
+    _PeriodicTable,
+    _symbols_to_blocks,
+    _symbols_to_categories,
+    _symbols_to_groups,
+    _symbols_to_periods,
+)
 from plasmapy.particles.exceptions import (
     InvalidElementError,
     InvalidIsotopeError,
@@ -44,6 +62,252 @@ from plasmapy.utils.exceptions import PlasmaPyFutureWarning
 __all__.sort()
 
 
+def _create_isotopes_by_element() -> Dict[str, Tuple[str, ...]]:
+    """
+    Create a dictionary with atomic symbols as keys and tuples of the
+    known isotopes of each element, sorted by mass number, as values.
+    """
+    isotopes_by_element = {element: [] for element in _elements}
+
+    for isotope, isotope_data in _isotopes.items():
+        atomic_numb = isotope_data["atomic number"]
+        if atomic_numb in _atomic_numbers_to_symbols:  # excludes neutrons
+            element = _atomic_numbers_to_symbols[atomic_numb]
+            isotopes_by_element[element].append(isotope)
+
+    return {
+        element: tuple(
+            sorted(isotopes, key=lambda isotope: _isotopes[isotope]["mass number"])
+        )
+        for element, isotopes in isotopes_by_element.items()
+    }
+
+
+_isotopes_by_element = _create_isotopes_by_element()
+
+_stable_isotope_symbols = frozenset(
+    isotope for isotope, isotope_data in _isotopes.items() if isotope_data["stable"]
+)
+
+_stable_isotopes_by_element = {
+    element: tuple(
+        isotope for isotope in isotopes if isotope in _stable_isotope_symbols
+    )
+    for element, isotopes in _isotopes_by_element.items()
+}
+
+_unstable_isotopes_by_element = {
+    element: tuple(
+        isotope for isotope in isotopes if isotope not in _stable_isotope_symbols
+    )
+    for element, isotopes in _isotopes_by_element.items()
+}
+
+_common_isotopes_by_element = {
+    element: tuple(
+        sorted(
+            (isotope for isotope in isotopes if "abundance" in _isotopes[isotope]),
+            key=lambda isotope: _isotopes[isotope]["abundance"],
+            reverse=True,
+        )
+    )
+    for element, isotopes in _isotopes_by_element.items()
+}
+
+
+def _join_isotopes_by_atomic_number(
+    isotopes_by_element: Dict[str, Tuple[str, ...]]
+) -> Tuple[str, ...]:
+    """
+    Combine the tuples of isotopes for each element into a single tuple
+    sorted by atomic number.
+    """
+    return tuple(
+        isotope
+        for atomic_numb in sorted(_atomic_numbers_to_symbols)
+        for isotope in isotopes_by_element[_atomic_numbers_to_symbols[atomic_numb]]
+    )
+
+
+_all_known_isotopes = _join_isotopes_by_atomic_number(_isotopes_by_element)
+_all_stable_isotopes = _join_isotopes_by_atomic_number(_stable_isotopes_by_element)
+_all_unstable_isotopes = _join_isotopes_by_atomic_number(_unstable_isotopes_by_element)
+_all_common_isotopes = _join_isotopes_by_atomic_number(_common_isotopes_by_element)
+_all_most_common_isotopes = _join_isotopes_by_atomic_number(
+    {
+        element: isotopes[0:1]
+        for element, isotopes in _common_isotopes_by_element.items()
+    }
+)
+
+# Lookups that let isotopic_abundance and is_stable skip creating a
+# Particle for canonical isotope symbols like "Pb-208" or "D"
+_isotopic_abundances = {
+    isotope: isotope_data["abundance"]
+    for isotope, isotope_data in _isotopes.items()
+    if "abundance" in isotope_data and isotope_data["atomic number"]
+}
+
+
+# Lookups used by the *_array functions for atomic and isotope symbols
+_atomic_numbers = {
+    **{element: data["atomic number"] for element, data in _elements.items()},
+    **{
+        isotope: isotope_data["atomic number"]
+        for isotope, isotope_data in _isotopes.items()
+        if isotope_data["atomic number"]
+    },
+}
+
+_mass_numbers = {
+    isotope: isotope_data["mass number"]
+    for isotope, isotope_data in _isotopes.items()
+    if isotope_data["atomic number"]
+}
+
+_standard_atomic_weights_in_kg = {
+    element: data["atomic mass"].to(u.kg).value
+    for element, data in _elements.items()
+    if "atomic mass" in data
+}
+
+
+def _by_atomic_number(symbols_to_values: Dict[str, Any], placeholder) -> np.ndarray:
+    """
+    Return an array of the values in ``symbols_to_values`` indexed by
+    atomic number, with ``placeholder`` at index 0.
+    """
+    return np.array(
+        [placeholder]
+        + [
+            symbols_to_values[_atomic_numbers_to_symbols[atomic_numb]]
+            for atomic_numb in range(1, len(_atomic_numbers_to_symbols) + 1)
+        ]
+    )
+
+
+# Arrays indexed by atomic number for the periodic_table_*_array functions
+_periods_by_atomic_number = _by_atomic_number(_symbols_to_periods, 0)
+_groups_by_atomic_number = _by_atomic_number(_symbols_to_groups, 0)
+_blocks_by_atomic_number = _by_atomic_number(_symbols_to_blocks, "")
+_categories_by_atomic_number = _by_atomic_number(_symbols_to_categories, "")
+
+
+@lru_cache(maxsize=512, typed=True)
+def _cached_atomic_symbol(argument: Union[str, Integral]) -> str:
+    """
+    Return the atomic symbol corresponding to ``argument``, remembering
+    the result so that repeated calls with the same argument do not
+    parse it again.
+    """
+    return atomic_symbol(argument)
+
+
+def _fast_atomic_symbol(
+    argument: Union[str, Integral], funcname: Optional[str] = None
+) -> str:
+    """
+    Return the atomic symbol corresponding to ``argument``, without
+    creating a `~plasmapy.particles.particle_class.Particle` when
+    ``argument`` is an atomic number or is already an atomic symbol.
+    The results for other `str` and `int` arguments are cached.  If
+    ``funcname`` is given, raise a `TypeError` that names it when
+    ``argument`` is not a `str` or `int`.
+    """
+    argument_type = type(argument)
+    if argument_type is int and argument in _atomic_numbers_to_symbols:
+        return _atomic_numbers_to_symbols[argument]
+    if argument_type is str and argument in _elements:
+        return argument
+    if isinstance(argument, (str, Integral)):
+        return _cached_atomic_symbol(argument)
+    if funcname is not None:
+        raise TypeError(
+            f"The argument to {funcname} must be either a string "
+            "representing the element or its symbol, or an integer "
+            "representing its atomic number."
+        )
+    return atomic_symbol(argument)
+
+
+def _lookup_array(
+    function: Callable,
+    lookup: Dict[str, Real],
+    particles: Iterable[Union[str, Integral, Particle]],
+    dtype,
+    funcname: str,
+) -> np.ndarray:
+    """
+    Return an array of the values of ``function`` for each of
+    ``particles``.  The values for strings that are keys of ``lookup``
+    are taken from ``lookup`` instead of calling ``function``.  Raise a
+    `TypeError` if ``particles`` is a `str`, naming the function
+    ``funcname``.
+    """
+    if isinstance(particles, str):
+        raise TypeError(
+            f"The argument to {funcname} must be an iterable "
+            "of particles, not a string."
+        )
+    return np.fromiter(
+        (
+            lookup[particle]
+            if isinstance(particle, str) and particle in lookup
+            else function(particle)
+            for particle in particles
+        ),
+        dtype=dtype,
+    )
+
+
+def _check_lookup_first(lookup: Callable[[str], Any]) -> Callable:
+    """
+    Return a decorator for functions of a particle and an optional mass
+    number that returns ``lookup(argument)`` when the only argument is
+    a `str` for which ``lookup`` does not return `None`, and otherwise
+    calls the decorated function.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if len(args) == 1 and not kwargs and isinstance(args[0], str):
+                value = lookup(args[0])
+                if value is not None:
+                    return value
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _isotope_stability(isotope: str) -> Optional[bool]:
+    """
+    Return whether ``isotope`` is stable if it is the symbol of a known
+    isotope, and `None` otherwise.
+    """
+    if isotope in _isotopes:
+        return isotope in _stable_isotope_symbols
+
+
+def _element_for_isotopes(argument: Union[str, Integral], funcname: str) -> str:
+    """
+    Return the atomic symbol of the element whose isotopes are
+    requested from ``funcname``.  If ``argument`` does not represent an
+    element, the exception is re-raised with a message that names
+    ``funcname``.
+    """
+    try:
+        return _fast_atomic_symbol(argument)
+    except InvalidElementError as exc:
+        raise InvalidElementError(
+            f"{funcname} is unable to get isotopes from an input of: {argument}"
+        ) from exc
+    except InvalidParticleError as exc:
+        raise InvalidParticleError(f"Invalid particle in {funcname}.") from exc
+
+
 @particle_input
 def atomic_number(element: Particle) -> Integral:
     """
@@ -196,6 +460,157 @@ def standard_atomic_weight(element: Particle) -> u.Quantity:
     return element.standard_atomic_weight
 
 
+def atomic_number_array(
+    elements: Iterable[Union[str, Integral, Particle]]
+) -> np.ndarray:
+    """
+    Return an array of the atomic numbers of many elements, isotopes,
+    or ions.
+
+    Parameters
+    ----------
+    elements: iterable of `str`, `int`, or `~plasmapy.particles.particle_class.Particle`
+        The elements, isotopes, or ions, each in a form accepted by
+        `~plasmapy.particles.atomic.atomic_number`.
+
+    Returns
+    -------
+    atomic_numbers: `~numpy.ndarray`
+        The atomic numbers of ``elements``.
+
+    Raises
+    ------
+    `~plasmapy.particles.exceptions.InvalidElementError`
+        If an item is a valid particle but not a valid element.
+
+    `~plasmapy.particles.exceptions.InvalidParticleError`
+        If an item does not correspond to a valid particle.
+
+    `TypeError`
+        If the argument is a `str` or an item is not a `str` or `int`.
+
+    See Also
+    --------
+    atomic_number
+
+    Notes
+    -----
+    Atomic and isotope symbols like ``"Fe"`` and ``"Fe-56"`` are looked
+    up directly, which is much faster than calling
+    `~plasmapy.particles.atomic.atomic_number` for each item.  Other
+    items are passed to `~plasmapy.particles.atomic.atomic_number`.
+
+    Examples
+    --------
+    >>> atomic_number_array(["H", "He-4", "Fe-56 3+", "oganesson"])
+    array([  1,   2,  26, 118])
+    """
+    return _lookup_array(
+        atomic_number, _atomic_numbers, elements, int, "atomic_number_array"
+    )
+
+
+def mass_number_array(isotopes: Iterable[Union[str, Particle]]) -> np.ndarray:
+    """
+    Return an array of the mass numbers of many isotopes.
+
+    Parameters
+    ----------
+    isotopes: iterable of `str` or `~plasmapy.particles.particle_class.Particle`
+        The isotopes, each in a form accepted by
+        `~plasmapy.particles.atomic.mass_number`.
+
+    Returns
+    -------
+    mass_numbers: `~numpy.ndarray`
+        The mass numbers of ``isotopes``.
+
+    Raises
+    ------
+    `~plasmapy.particles.exceptions.InvalidParticleError`
+        If an item does not correspond to a valid particle.
+
+    `~plasmapy.particles.exceptions.InvalidIsotopeError`
+        If an item does not correspond to a valid isotope.
+
+    `TypeError`
+        If the argument is a `str` or an item is not a `str`.
+
+    See Also
+    --------
+    mass_number
+
+    Notes
+    -----
+    Isotope symbols like ``"Pb-208"`` are looked up directly, which is
+    much faster than calling `~plasmapy.particles.atomic.mass_number`
+    for each item.  Other items are passed to
+    `~plasmapy.particles.atomic.mass_number`.
+
+    Examples
+    --------
+    >>> mass_number_array(["H-1", "Pb-208", "tritium", "alpha"])
+    array([  1, 208,   3,   4])
+    """
+    return _lookup_array(mass_number, _mass_numbers, isotopes, int, "mass_number_array")
+
+
+def standard_atomic_weight_array(
+    elements: Iterable[Union[str, Integral, Particle]]
+) -> u.Quantity:
+    """
+    Return the standard (conventional) atomic weights of many elements.
+
+    Parameters
+    ----------
+    elements: iterable of `str`, `int`, or `~plasmapy.particles.particle_class.Particle`
+        The elements, each in a form accepted by
+        `~plasmapy.particles.atomic.standard_atomic_weight`.
+
+    Returns
+    -------
+    atomic_weights: `~astropy.units.Quantity`
+        The standard atomic weights of ``elements`` as a single array
+        in kilograms.
+
+    Raises
+    ------
+    `~plasmapy.particles.exceptions.InvalidElementError`
+        If an item is a valid particle but not a valid element.
+
+    `~plasmapy.particles.exceptions.InvalidParticleError`
+        If an item does not correspond to a valid particle.
+
+    `TypeError`
+        If the argument is a `str` or an item is not a `str` or `int`.
+
+    See Also
+    --------
+    standard_atomic_weight
+
+    Notes
+    -----
+    Atomic symbols like ``"Fe"`` are looked up directly, which is much
+    faster than calling
+    `~plasmapy.particles.atomic.standard_atomic_weight` for each item.
+    Other items are passed to
+    `~plasmapy.particles.atomic.standard_atomic_weight`.
+
+    Examples
+    --------
+    >>> standard_atomic_weight_array(["H", "lead"]).to("u")
+    <Quantity [  1.008, 207.2  ] u>
+    """
+    atomic_weights = _lookup_array(
+        lambda element: standard_atomic_weight(element).value,
+        _standard_atomic_weights_in_kg,
+        elements,
+        float,
+        "standard_atomic_weight_array",
+    )
+    return u.Quantity(atomic_weights, u.kg)
+
+
 @particle_input(exclude={"neutrino", "antineutrino"})
 def particle_mass(
     particle: Particle, *, Z: Integral = None, mass_numb: Integral = None
@@ -250,6 +665,7 @@ def particle_mass(
     return particle.mass
 
 
+@_check_lookup_first(_isotopic_abundances.get)
 @particle_input
 def isotopic_abundance(isotope: Particle, mass_numb: Optional[Integral] = None) -> Real:
     """
@@ -423,6 +839,7 @@ def electric_charge(particle: Particle) -> u.C:
     return particle.charge
 
 
+@_check_lookup_first(_isotope_stability)
 @particle_input
 def is_stable(particle: Particle, mass_numb: Optional[Integral] = None) -> bool:
     """
@@ -587,37 +1004,14 @@ def known_isotopes(argument: Union[str, Integral] = None) -> List[str]:
 
     # TODO: Allow Particle objects representing elements to be inputs
 
-    def known_isotopes_for_element(argument):
-        element = atomic_symbol(argument)
-        isotopes = []
-        for isotope in _isotopes.keys():
-            if element + "-" in isotope and isotope[0 : len(element)] == element:
-                isotopes.append(isotope)
-        if element == "H":
-            isotopes.insert(1, "D")
-            isotopes.insert(2, "T")
-        mass_numbers = [mass_number(isotope) for isotope in isotopes]
-        sorted_isotopes = [
-            mass_number
-            for (isotope, mass_number) in sorted(zip(mass_numbers, isotopes))
-        ]
-        return sorted_isotopes
+    def known_isotopes_for_element(element: str) -> List[str]:
+        return list(_isotopes_by_element[element])
 
     if argument is not None:
-        try:
-            element = atomic_symbol(argument)
-            isotopes_list = known_isotopes_for_element(element)
-        except InvalidElementError:
-            raise InvalidElementError(
-                "known_isotopes is unable to get "
-                f"isotopes from an input of: {argument}"
-            )
-        except InvalidParticleError:
-            raise InvalidParticleError("Invalid particle in known_isotopes.")
+        element = _element_for_isotopes(argument, "known_isotopes")
+        isotopes_list = known_isotopes_for_element(element)
     elif argument is None:
-        isotopes_list = []
-        for atomic_numb in range(1, len(_elements.keys()) + 1):
-            isotopes_list += known_isotopes_for_element(atomic_numb)
+        isotopes_list = list(_all_known_isotopes)
 
     return isotopes_list
 
@@ -694,48 +1088,22 @@ def common_isotopes(
     # TODO: Allow Particle objects representing elements to be inputs
 
     def common_isotopes_for_element(
-        argument: Union[str, int], most_common_only: Optional[bool]
+        element: str, most_common_only: Optional[bool]
     ) -> List[str]:
 
-        isotopes = known_isotopes(argument)
-
-        CommonIsotopes = [
-            isotope for isotope in isotopes if "abundance" in _isotopes[isotope].keys()
-        ]
-
-        isotopic_abundances = [
-            _isotopes[isotope]["abundance"] for isotope in CommonIsotopes
-        ]
-
-        sorted_isotopes = [
-            iso_comp
-            for (isotope, iso_comp) in sorted(zip(isotopic_abundances, CommonIsotopes))
-        ]
-
-        sorted_isotopes.reverse()
-
-        if most_common_only and len(sorted_isotopes) > 1:
-            sorted_isotopes = sorted_isotopes[0:1]
-
-        return sorted_isotopes
+        isotopes = _common_isotopes_by_element[element]
+        if most_common_only:
+            return list(isotopes[0:1])
+        return list(isotopes)
 
     if argument is not None:
-
-        try:
-            element = atomic_symbol(argument)
-            isotopes_list = common_isotopes_for_element(element, most_common_only)
-        except InvalidParticleError:
-            raise InvalidParticleError("Invalid particle")
-        except InvalidElementError:
-            raise InvalidElementError(
-                "common_isotopes is unable to get isotopes "
-                f"from an input of: {argument}"
-            )
-
+        element = _element_for_isotopes(argument, "common_isotopes")
+        isotopes_list = common_isotopes_for_element(element, most_common_only)
     elif argument is None:
-        isotopes_list = []
-        for atomic_numb in range(1, 119):
-            isotopes_list += common_isotopes_for_element(atomic_numb, most_common_only)
+        if most_common_only:
+            isotopes_list = list(_all_most_common_isotopes)
+        else:
+            isotopes_list = list(_all_common_isotopes)
 
     return isotopes_list
 
@@ -812,31 +1180,20 @@ def stable_isotopes(
     # TODO: Allow Particle objects representing elements to be inputs
 
     def stable_isotopes_for_element(
-        argument: Union[str, int], stable_only: Optional[bool]
+        element: str, stable_only: Optional[bool]
     ) -> List[str]:
-        KnownIsotopes = known_isotopes(argument)
-        StableIsotopes = [
-            isotope
-            for isotope in KnownIsotopes
-            if _isotopes[isotope]["stable"] == stable_only
-        ]
-        return StableIsotopes
+        if stable_only:
+            return list(_stable_isotopes_by_element[element])
+        return list(_unstable_isotopes_by_element[element])
 
     if argument is not None:
-        try:
-            element = atomic_symbol(argument)
-            isotopes_list = stable_isotopes_for_element(element, not unstable)
-        except InvalidParticleError:
-            raise InvalidParticleError("Invalid particle in stable_isotopes")
-        except InvalidElementError:
-            raise InvalidElementError(
-                "stable_isotopes is unable to get isotopes "
-                f"from an input of: {argument}"
-            )
+        element = _element_for_isotopes(argument, "stable_isotopes")
+        isotopes_list = stable_isotopes_for_element(element, not unstable)
     elif argument is None:
-        isotopes_list = []
-        for atomic_numb in range(1, 119):
-            isotopes_list += stable_isotopes_for_element(atomic_numb, not unstable)
+        if unstable:
+            isotopes_list = list(_all_unstable_isotopes)
+        else:
+            isotopes_list = list(_all_stable_isotopes)
 
     return isotopes_list
 
@@ -955,15 +1312,8 @@ def periodic_table_period(argument: Union[str, Integral]) -> Integral:
     2
     """
     # TODO: Implement @particle_input
-    if not isinstance(argument, (str, Integral)):
-        raise TypeError(
-            "The argument to periodic_table_period must be either a "
-            "string representing the element or its symbol, or an "
-            "integer representing its atomic number."
-        )
-    symbol = atomic_symbol(argument)
-    period = _elements[symbol]["period"]
-    return period
+    symbol = _fast_atomic_symbol(argument, "periodic_table_period")
+    return _symbols_to_periods[symbol]
 
 
 def periodic_table_group(argument: Union[str, Integral]) -> Integral:
@@ -1009,15 +1359,8 @@ def periodic_table_group(argument: Union[str, Integral]) -> Integral:
     2
     """
     # TODO: Implement @particle_input
-    if not isinstance(argument, (str, Integral)):
-        raise TypeError(
-            "The argument to periodic_table_group must be "
-            "either a string representing the element or its "
-            "symbol, or an integer representing its atomic number."
-        )
-    symbol = atomic_symbol(argument)
-    group = _elements[symbol]["group"]
-    return group
+    symbol = _fast_atomic_symbol(argument, "periodic_table_group")
+    return _symbols_to_groups[symbol]
 
 
 def periodic_table_block(argument: Union[str, Integral]) -> str:
@@ -1063,15 +1406,8 @@ def periodic_table_block(argument: Union[str, Integral]) -> str:
     's'
     """
     # TODO: Implement @particle_input
-    if not isinstance(argument, (str, Integral)):
-        raise TypeError(
-            "The argument to periodic_table_block must be "
-            "either a string representing the element or its "
-            "symbol, or an integer representing its atomic number."
-        )
-    symbol = atomic_symbol(argument)
-    block = _elements[symbol]["block"]
-    return block
+    symbol = _fast_atomic_symbol(argument, "periodic_table_block")
+    return _symbols_to_blocks[symbol]
 
 
 def periodic_table_category(argument: Union[str, Integral]) -> str:
@@ -1115,15 +1451,237 @@ def periodic_table_category(argument: Union[str, Integral]) -> str:
     'transition metal'
     """
     # TODO: Implement @particle_input
-    if not isinstance(argument, (str, Integral)):
-        raise TypeError(
-            "The argument to periodic_table_category must be "
-            "either a string representing the element or its "
-            "symbol, or an integer representing its atomic number."
+    symbol = _fast_atomic_symbol(argument, "periodic_table_category")
+    return _symbols_to_categories[symbol]
+
+
+def periodic_table_info(argument: Union[str, Integral]) -> _PeriodicTable:
+    """
+    Return the periodic table group, period, block, and category of an
+    element at once.
+
+    Parameters
+    ----------
+    argument: `str` or `int`
+        Atomic number (either integer or string), atomic symbol (e.g.,
+        ``"H"``, string), or element name (e.g., ``"francium"``,
+        string).
+
+    Returns
+    -------
+    info
+        An object with ``group``, ``period``, ``block``, and
+        ``category`` attributes, like the one returned by
+        `~plasmapy.particles.particle_class.Particle.periodic_table`.
+
+    Raises
+    ------
+    `TypeError`
+        If the argument is not a `str` or `int`.
+
+    See Also
+    --------
+    periodic_table_period : returns periodic table period of element.
+
+    periodic_table_group : returns periodic table group of element.
+
+    periodic_table_block : returns periodic table block of element.
+
+    periodic_table_category : returns periodic table category of element.
+
+    Notes
+    -----
+    The argument is parsed only once, so this function is faster than
+    calling each of the other ``periodic_table_*`` functions when more
+    than one of these properties is needed.
+
+    Examples
+    --------
+    >>> info = periodic_table_info("gold")
+    >>> info.group, info.period, info.block, info.category
+    (11, 6, 'd', 'transition metal')
+    """
+    symbol = _fast_atomic_symbol(argument, "periodic_table_info")
+    return _PeriodicTable(
+        group=_symbols_to_groups[symbol],
+        period=_symbols_to_periods[symbol],
+        block=_symbols_to_blocks[symbol],
+        category=_symbols_to_categories[symbol],
+    )
+
+
+def _periodic_table_array(
+    lookup_table: np.ndarray, atomic_numbers: Iterable[Integral], funcname: str
+) -> np.ndarray:
+    """
+    Return the values of ``lookup_table`` for each of ``atomic_numbers``
+    after checking that they are all atomic numbers of known elements.
+    """
+    atomic_numbers = np.asarray(atomic_numbers)
+    if atomic_numbers.size and not np.issubdtype(atomic_numbers.dtype, np.integer):
+        raise TypeError(f"The argument to {funcname} must be an array of integers.")
+    invalid = (atomic_numbers < 1) | (atomic_numbers >= len(lookup_table))
+    if np.any(invalid):
+        raise InvalidParticleError(
+            f"The argument to {funcname} includes values that are not "
+            f"atomic numbers of known elements: {atomic_numbers[invalid]}."
         )
-    symbol = atomic_symbol(argument)
-    category = _elements[symbol]["category"]
-    return category
+    return lookup_table[atomic_numbers.astype(np.intp)]
+
+
+def periodic_table_period_array(atomic_numbers: Iterable[Integral]) -> np.ndarray:
+    """
+    Return the periodic table periods of many elements.
+
+    Parameters
+    ----------
+    atomic_numbers: array_like of `int`
+        The atomic numbers of the elements.
+
+    Returns
+    -------
+    periods: `~numpy.ndarray`
+        The periodic table periods of the elements, with the same shape
+        as ``atomic_numbers``.
+
+    Raises
+    ------
+    `TypeError`
+        If ``atomic_numbers`` does not contain integers.
+
+    `~plasmapy.particles.exceptions.InvalidParticleError`
+        If any of ``atomic_numbers`` is not the atomic number of a known
+        element.
+
+    See Also
+    --------
+    periodic_table_period : returns periodic table period of element.
+
+    Examples
+    --------
+    >>> periodic_table_period_array([1, 26, 118])
+    array([1, 4, 7])
+    """
+    return _periodic_table_array(
+        _periods_by_atomic_number, atomic_numbers, "periodic_table_period_array"
+    )
+
+
+def periodic_table_group_array(atomic_numbers: Iterable[Integral]) -> np.ndarray:
+    """
+    Return the periodic table groups of many elements.
+
+    Parameters
+    ----------
+    atomic_numbers: array_like of `int`
+        The atomic numbers of the elements.
+
+    Returns
+    -------
+    groups: `~numpy.ndarray`
+        The periodic table groups of the elements, with the same shape
+        as ``atomic_numbers``.
+
+    Raises
+    ------
+    `TypeError`
+        If ``atomic_numbers`` does not contain integers.
+
+    `~plasmapy.particles.exceptions.InvalidParticleError`
+        If any of ``atomic_numbers`` is not the atomic number of a known
+        element.
+
+    See Also
+    --------
+    periodic_table_group : returns periodic table group of element.
+
+    Examples
+    --------
+    >>> periodic_table_group_array([1, 26, 118])
+    array([ 1,  8, 18])
+    """
+    return _periodic_table_array(
+        _groups_by_atomic_number, atomic_numbers, "periodic_table_group_array"
+    )
+
+
+def periodic_table_block_array(atomic_numbers: Iterable[Integral]) -> np.ndarray:
+    """
+    Return the periodic table blocks of many elements.
+
+    Parameters
+    ----------
+    atomic_numbers: array_like of `int`
+        The atomic numbers of the elements.
+
+    Returns
+    -------
+    blocks: `~numpy.ndarray`
+        The periodic table blocks of the elements as strings, with the
+        same shape as ``atomic_numbers``.
+
+    Raises
+    ------
+    `TypeError`
+        If ``atomic_numbers`` does not contain integers.
+
+    `~plasmapy.particles.exceptions.InvalidParticleError`
+        If any of ``atomic_numbers`` is not the atomic number of a known
+        element.
+
+    See Also
+    --------
+    periodic_table_block : returns periodic table block of element.
+
+    Examples
+    --------
+    >>> periodic_table_block_array([1, 26, 118])
+    array(['s', 'd', 'p'], dtype='<U1')
+    """
+    return _periodic_table_array(
+        _blocks_by_atomic_number, atomic_numbers, "periodic_table_block_array"
+    )
+
+
+def periodic_table_category_array(atomic_numbers: Iterable[Integral]) -> np.ndarray:
+    """
+    Return the periodic table categories of many elements.
+
+    Parameters
+    ----------
+    atomic_numbers: array_like of `int`
+        The atomic numbers of the elements.
+
+    Returns
+    -------
+    categories: `~numpy.ndarray`
+        The periodic table categories of the elements as strings, with
+        the same shape as ``atomic_numbers``.
+
+    Raises
+    ------
+    `TypeError`
+        If ``atomic_numbers`` does not contain integers.
+
+    `~plasmapy.particles.exceptions.InvalidParticleError`
+        If any of ``atomic_numbers`` is not the atomic number of a known
+        element.
+
+    See Also
+    --------
+    periodic_table_category : returns periodic table category of element.
+
+    Examples
+    --------
+    >>> periodic_table_category_array([2, 85])
+    array(['noble gas', 'halogen'], dtype='<U21')
+    """
+    return _periodic_table_array(
+        _categories_by_atomic_number, atomic_numbers, "periodic_table_category_array"
+    )
+
+
+_electron_symbols = frozenset({"e", "e-", "electron"})
 
 
 def _is_electron(arg: Any) -> bool:
@@ -1136,4 +1694,4 @@ def _is_electron(arg: Any) -> bool:
     if not isinstance(arg, str):
         return False
 
-    return arg in ["e", "e-"] or arg.lower() == "electron"
+    return arg in _electron_symbols or arg.lower() == "electron"
@@ -6,9 +6,12 @@ as arguments and passes through the corresponding instance of the
 """
 __all__ = ["particle_input"]
 
+import collections
+import copy
 import functools
 import inspect
 import numbers
+import threading
 
 from typing import Any, Callable, List, Optional, Set, Tuple, Union
 
@@ -72,6 +75,57 @@ def _category_errmsg(particle, require, exclude, any_of, funcname) -> str:
     return category_errmsg
 
 
+_particle_cache = collections.OrderedDict()
+_particle_cache_maxsize = 4096
+_particle_cache_lock = threading.Lock()
+
+
+def _get_particle(
+    argument: Union[str, numbers.Integral],
+    mass_numb: numbers.Integral = None,
+    Z: numbers.Integral = None,
+) -> Particle:
+    """
+    Return the `~plasmapy.particles.particle_class.Particle` corresponding
+    to ``argument``, avoiding parsing ``argument`` again when possible.
+
+    Particles created from only a `str` or `int` are kept in a
+    least-recently-used cache of up to ``_particle_cache_maxsize``
+    entries, which is guarded by a lock so that it may be used from
+    multiple threads.  A shallow copy of the cached particle is
+    returned, so that modifying the returned particle in place (e.g.,
+    with ``ionize(inplace=True)``) does not affect later calls.
+    Particles created with ``mass_numb`` or ``Z``, or whose creation
+    issues a warning (i.e., ions with a charge number of ``-3`` or
+    less), are not cached so that any warnings continue to be issued
+    on every call.
+    """
+    if mass_numb is not None or Z is not None:
+        return Particle(argument, mass_numb=mass_numb, Z=Z)
+
+    with _particle_cache_lock:
+        particle = _particle_cache.get(argument)
+        if particle is not None:
+            _particle_cache.move_to_end(argument)
+
+    if particle is None:
+        particle = Particle(argument)
+
+        charge_number = particle._attributes["charge number"]
+        issues_warning = (
+            particle.element and charge_number is not None and charge_number <= -3
+        )
+        if issues_warning:
+            return particle
+
+        with _particle_cache_lock:
+            _particle_cache[argument] = particle
+            if len(_particle_cache) > _particle_cache_maxsize:
+                _particle_cache.popitem(last=False)
+
+    return copy.copy(particle)
+
+
 def particle_input(
     wrapped_function: Callable = None,
     require: Union[str, Set, List, Tuple] = None,
@@ -437,7 +491,10 @@ def particle_input(
                 )
 
             try:
-                particle = Particle(argval, Z=Z, mass_numb=mass_numb)
+                if isinstance(argval, (numbers.Integral, str)):
+                    particle = _get_particle(argval, mass_numb=mass_numb, Z=Z)
+                else:
+                    particle = Particle(argval, Z=Z, mass_numb=mass_numb)
             except InvalidParticleError as e:
                 raise InvalidParticleError(
                     _particle_errmsg(argname, argval, Z, mass_numb, funcname)
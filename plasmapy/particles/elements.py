@@ -13,17 +13,31 @@ import astropy.units as u
 import collections
 import json
 import pkgutil
+import sys
 
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class _PeriodicTable:
+    # __slots__ is set by hand because dataclass(slots=True) requires
+    # Python 3.10 or newer
+    __slots__ = ("group", "period", "block", "category")
+
     group: int
     period: int
     block: str
     category: str
 
+    # Frozen dataclasses with __slots__ cannot be pickled or copied
+    # without these methods until Python 3.10
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 def _element_obj_hook(obj):
     if "unit" in obj:
@@ -52,6 +66,14 @@ _elements = json.loads(
 )
 
 
+# Strings loaded from JSON are not interned, so intern the few distinct
+# blocks and categories.  Every element then shares one object for each
+# value, and equality checks against interned strings like the literal
+# "p" succeed on an identity comparison.
+for elemdict in _elements.values():
+    elemdict["block"] = sys.intern(elemdict["block"])
+    elemdict["category"] = sys.intern(elemdict["category"])
+
 _atomic_numbers_to_symbols = {
     elemdict["atomic number"]: symb for (symb, elemdict) in _elements.items()
 }
@@ -59,3 +81,15 @@ _atomic_numbers_to_symbols = {
 _element_names_to_symbols = {
     elemdict["element name"]: symb for (symb, elemdict) in _elements.items()
 }
+
+_symbols_to_periods = {
+    symb: elemdict["period"] for (symb, elemdict) in _elements.items()
+}
+
+_symbols_to_groups = {symb: elemdict["group"] for (symb, elemdict) in _elements.items()}
+
+_symbols_to_blocks = {symb: elemdict["block"] for (symb, elemdict) in _elements.items()}
+
+_symbols_to_categories = {
+    symb: elemdict["category"] for (symb, elemdict) in _elements.items()
+}
@@ -113,6 +113,29 @@ def _create_alias_dicts(Particles: dict) -> (Dict[str, str], Dict[str, str]):
 
 _case_sensitive_aliases, _case_insensitive_aliases = _create_alias_dicts(_Particles)
 
+_standard_particle_symbols = set(_case_sensitive_aliases.values()) | set(
+    _case_insensitive_aliases.values()
+)
+
+# Atomic symbols mapped to themselves and lowercase element names mapped
+# to atomic symbols.  Since atomic symbols are capitalized, a lowercased
+# string can only match an element name.
+_element_symbols_and_names_to_symbols = {
+    **{symbol: symbol for symbol in _atomic_numbers_to_symbols.values()},
+    **_element_names_to_symbols,
+}
+
+# Matches the run of plus or minus signs at the end of strings like 'H-'
+# and 'Pb-209+++' that contain charge information.
+_trailing_charge_signs = re.compile(r"(\++|-+)$")
+
+# Matches charge information like '1+', '+1', '3-', and '-3' in strings
+# like 'H 1-' and 'Fe-56 +3'.  Other formats (e.g., Roman numerals) are
+# handled separately.
+_charge_info_pattern = re.compile(
+    r"(?P<sign_before>[+-]?)(?P<number>\d+)(?P<sign_after>[+-]?)"
+)
+
 
 def _dealias_particle_aliases(alias: Union[str, Integral]) -> str:
     """
@@ -124,17 +147,12 @@ def _dealias_particle_aliases(alias: Union[str, Integral]) -> str:
     """
     if not isinstance(alias, str):
         symbol = alias
-    elif (
-        alias in _case_sensitive_aliases.values()
-        or alias in _case_insensitive_aliases.values()
-    ):
+    elif alias in _standard_particle_symbols:
         symbol = alias
     elif alias in _case_sensitive_aliases.keys():
         symbol = _case_sensitive_aliases[alias]
-    elif alias.lower() in _case_insensitive_aliases.keys():
-        symbol = _case_insensitive_aliases[alias.lower()]
     else:
-        symbol = alias
+        symbol = _case_insensitive_aliases.get(alias.lower(), alias)
     return symbol
 
 
@@ -232,6 +250,13 @@ def _parse_and_check_atomic_input(
         if arg.count(" ") == 1:  # Cases like 'H 1-' and 'Fe-56 1+'
             isotope_info, charge_info = arg.split(" ")
 
+            match = _charge_info_pattern.fullmatch(charge_info)
+            if match and bool(match["sign_before"]) != bool(match["sign_after"]):
+                Z_from_arg = int(match["number"])
+                if "-" in charge_info:
+                    Z_from_arg = -Z_from_arg
+                return isotope_info, Z_from_arg
+
             sign_indicator_only_on_one_end = charge_info.endswith(
                 ("-", "+")
             ) ^ charge_info.startswith(("-", "+"))
@@ -258,12 +283,11 @@ def _parse_and_check_atomic_input(
                 raise InvalidParticleError(invalid_charge_errmsg) from None
 
         elif arg.endswith(("-", "+")):  # Cases like 'H-' and 'Pb-209+++'
-            char = arg[-1]
-            match = re.match(f"[{char}]*", arg[::-1])
-            Z_from_arg = match.span()[1]
-            isotope_info = arg[0 : len(arg) - match.span()[1]]
+            charge_signs = _trailing_charge_signs.search(arg).group()
+            Z_from_arg = len(charge_signs)
+            isotope_info = arg[0 : len(arg) - Z_from_arg]
 
-            if char == "-":
+            if charge_signs[0] == "-":
                 Z_from_arg = -Z_from_arg
             if isotope_info.endswith(("-", "+")):
                 raise InvalidParticleError(invalid_charge_errmsg) from None
@@ -291,17 +315,17 @@ def _parse_and_check_atomic_input(
         elif isotope_info == "p":
             element_info = "H"
             mass_numb = 1
-        elif "-" not in isotope_info:
-            element_info = isotope_info
-            mass_numb = None
-        elif isotope_info.count("-") == 1:
-            element_info, mass_numb_str = isotope_info.split("-")
-            try:
-                mass_numb = int(mass_numb_str)
-            except ValueError:
-                raise InvalidParticleError(
-                    f"Invalid mass number in isotope string '{isotope_info}'."
-                ) from None
+        else:
+            element_info, dash, mass_numb_str = isotope_info.partition("-")
+            if not dash:
+                mass_numb = None
+            else:
+                try:
+                    mass_numb = int(mass_numb_str)
+                except ValueError:
+                    raise InvalidParticleError(
+                        f"Invalid mass number in isotope string '{isotope_info}'."
+                    ) from None
 
         return element_info, mass_numb
 
@@ -310,11 +334,10 @@ def _parse_and_check_atomic_input(
         Receive a `str` representing an element's symbol or
         name, and returns a `str` representing the atomic symbol.
         """
-        if element_info.lower() in _element_names_to_symbols.keys():
-            element = _element_names_to_symbols[element_info.lower()]
-        elif element_info in _atomic_numbers_to_symbols.values():
-            element = element_info
-        else:
+        element = _element_symbols_and_names_to_symbols.get(element_info)
+        if element is None:
+            element = _element_symbols_and_names_to_symbols.get(element_info.lower())
+        if element is None:
             raise InvalidParticleError(
                 f"The string '{element_info}' does not correspond to "
                 f"a valid element."
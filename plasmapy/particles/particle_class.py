@@ -21,7 +21,7 @@ from abc import ABC, abstractmethod
 from collections import defaultdict, namedtuple
 from datetime import datetime
 from numbers import Integral, Real
-from typing import Iterable, List, Optional, Set, Tuple, Union
+from typing import FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
 from plasmapy.particles.elements import _elements, _PeriodicTable
 from plasmapy.particles.exceptions import (
@@ -51,6 +51,12 @@ from plasmapy.utils import roman
 from plasmapy.utils.decorators import deprecated
 from plasmapy.utils.exceptions import PlasmaPyFutureWarning
 
+# Accessing astropy constants and converting their units is slow, so
+# the values needed when creating particles and finding their masses
+# are looked up once at import.
+_elementary_charge = const.e.si
+_electron_mass = const.m_e.to(u.u)
+
 _classification_categories = {
     "lepton",
     "antilepton",
@@ -459,6 +465,8 @@ class Particle(AbstractPhysicalParticle):
         self._categories = set()
         categories = self._categories
 
+        self._mass = None
+
         # If the argument corresponds to one of the case-sensitive or
         # case-insensitive aliases for particles, return the standard
         # symbol. Otherwise, return the original argument.
@@ -563,9 +571,9 @@ class Particle(AbstractPhysicalParticle):
             categories.add(Element["category"])
 
         if attributes["charge number"] == 1:
-            attributes["charge"] = const.e.si
+            attributes["charge"] = _elementary_charge
         elif attributes["charge number"] is not None:
-            attributes["charge"] = attributes["charge number"] * const.e.si
+            attributes["charge"] = attributes["charge number"] * _elementary_charge
 
         if attributes["charge number"]:
             categories.add("charged")
@@ -962,10 +970,7 @@ class Particle(AbstractPhysicalParticle):
         """
         if self._attributes["charge"] is None:
             raise ChargeError(f"The charge of particle {self} has not been specified.")
-        if self._attributes["charge number"] == 1:
-            return const.e.si
-
-        return self._attributes["charge"]
+        return self._attributes["charge"].copy()
 
     @property
     def standard_atomic_weight(self) -> u.kg:
@@ -1034,10 +1039,18 @@ class Particle(AbstractPhysicalParticle):
         <Quantity 6.64465...e-27 kg>
         """
 
+        # The mass is calculated once and stored, since the arithmetic
+        # with Quantity objects dominates the cost of this attribute.
+        # A copy is returned so that in-place operations on the result
+        # do not change the stored value.
+
+        if self._mass is not None:
+            return self._mass.copy()
+
         if self._attributes["mass"] is not None:
-            return self._attributes["mass"].to(u.kg)
+            mass = self._attributes["mass"]
 
-        if self.is_ion:
+        elif self.is_ion:
 
             if self.isotope:
                 base_mass = self._attributes["isotope mass"]
@@ -1049,21 +1062,24 @@ class Particle(AbstractPhysicalParticle):
                     f"The mass of ion '{self.ionic_symbol}' is not available."
                 )
 
-            mass = base_mass - self.charge_number * const.m_e
+            mass = base_mass - self.charge_number * _electron_mass
 
-            return mass.to(u.kg)
-
-        if self.element:
+        elif self.element:
 
             if self.isotope:
                 mass = self._attributes["isotope mass"]
             else:
                 mass = self._attributes["standard atomic weight"]
 
-            if mass is not None:
-                return mass.to(u.kg)
+        else:
+            mass = None
+
+        if mass is None:
+            raise MissingParticleDataError(f"The mass of {self} is not available.")
+
+        self._mass = mass.to(u.kg)
 
-        raise MissingParticleDataError(f"The mass of {self} is not available.")
+        return self._mass.copy()
 
     @property
     def nuclide_mass(self) -> u.kg:
@@ -1105,7 +1121,7 @@ class Particle(AbstractPhysicalParticle):
             )
 
         _nuclide_mass = (
-            self._attributes["isotope mass"] - self.atomic_number * const.m_e
+            self._attributes["isotope mass"] - self.atomic_number * _electron_mass
         )
 
         return _nuclide_mass.to(u.kg)
@@ -1311,14 +1327,14 @@ class Particle(AbstractPhysicalParticle):
         >>> D.isotopic_abundance
         0.000115
         """
-        from .atomic import common_isotopes
+        from .atomic import _common_isotopes_by_element
 
         if not self.isotope or self.is_ion:  # coverage: ignore
             raise InvalidIsotopeError(_category_errmsg(self.symbol, "isotope"))
 
         abundance = self._attributes.get("isotopic abundance", 0.0)
 
-        if not common_isotopes(self.element):
+        if not _common_isotopes_by_element[self.element]:
             warnings.warn(
                 f"No isotopes of {self.element} have an isotopic abundance. "
                 f"The isotopic abundance of {self.isotope} is being returned as 0.0",
@@ -1412,7 +1428,8 @@ class Particle(AbstractPhysicalParticle):
             raise MissingParticleDataError(
                 f"The half-life of '{self.symbol}' is not available."
             )
-        return self._attributes["half-life"]
+        half_life = self._attributes["half-life"]
+        return half_life.copy() if isinstance(half_life, u.Quantity) else half_life
 
     @property
     def spin(self) -> Real:
@@ -1465,7 +1482,7 @@ class Particle(AbstractPhysicalParticle):
             raise InvalidElementError(_category_errmsg(self.symbol, "element"))
 
     @property
-    def categories(self) -> Set[str]:
+    def categories(self) -> FrozenSet[str]:
         """
         The particle's categories.
 
@@ -1478,7 +1495,7 @@ class Particle(AbstractPhysicalParticle):
         False
 
         """
-        return self._categories
+        return frozenset(self._categories)
 
     def is_category(
         self,
@@ -2112,7 +2129,7 @@ class CustomParticle(AbstractPhysicalParticle):
         if np.isnan(q):
             self._charge = q
         elif isinstance(q, Real):
-            self._charge = q * const.e.si
+            self._charge = q * _elementary_charge
             warnings.warn(
                 f"CustomParticle charge set to {q} times the elementary charge."
             )
@@ -19,6 +19,7 @@ from plasmapy.utils.pytest_helpers import run_test
 from ..atomic import (
     _is_electron,
     atomic_number,
+    atomic_number_array,
     charge_number,
     common_isotopes,
     electric_charge,
@@ -28,17 +29,26 @@ from ..atomic import (
     isotopic_abundance,
     known_isotopes,
     mass_number,
+    mass_number_array,
     particle_mass,
     periodic_table_block,
+    periodic_table_block_array,
     periodic_table_category,
+    periodic_table_category_array,
     periodic_table_group,
+    periodic_table_group_array,
+    periodic_table_info,
     periodic_table_period,
+    periodic_table_period_array,
     reduced_mass,
     stable_isotopes,
     standard_atomic_weight,
+    standard_atomic_weight_array,
 )
+from ..elements import _elements
 from ..isotopes import _isotopes
 from ..nuclear import nuclear_binding_energy, nuclear_reaction_energy
+from ..particle_class import Particle
 from ..symbols import atomic_symbol, element_name, isotope_symbol
 
 # function to be tested, argument(s), expected result/outcome
@@ -404,6 +414,72 @@ class TestInvalidPeriodicElement:
             periodic_table_group(("B", "Ti", "Ge"))
 
 
+@pytest.mark.parametrize("argument", [1, 26, "Fe", "iron", "82", "Og", np.int64(2)])
+def test_periodic_table_info(argument):
+    """Test that `periodic_table_info` matches the individual
+    ``periodic_table_*`` functions."""
+    info = periodic_table_info(argument)
+    assert info.group == periodic_table_group(argument)
+    assert info.period == periodic_table_period(argument)
+    assert info.block == periodic_table_block(argument)
+    assert info.category == periodic_table_category(argument)
+    assert info == Particle(argument).periodic_table
+
+
+@pytest.mark.parametrize("argument", [("Ne", "Na"), 1.0, None])
+def test_periodic_table_info_type_error(argument):
+    with pytest.raises(TypeError):
+        periodic_table_info(argument)
+
+
+periodic_table_array_functions_table = [
+    (periodic_table_period_array, periodic_table_period),
+    (periodic_table_group_array, periodic_table_group),
+    (periodic_table_block_array, periodic_table_block),
+    (periodic_table_category_array, periodic_table_category),
+]
+
+
+@pytest.mark.parametrize(
+    "array_func, scalar_func", periodic_table_array_functions_table
+)
+def test_periodic_table_array_functions(array_func, scalar_func):
+    """Test that the ``periodic_table_*_array`` functions give the same
+    values as the corresponding scalar functions."""
+    atomic_numbers = np.arange(1, 119).reshape(2, 59)
+    result = array_func(atomic_numbers)
+    assert result.shape == atomic_numbers.shape
+    assert result.tolist() == [
+        [scalar_func(int(Z)) for Z in row] for row in atomic_numbers
+    ]
+
+
+@pytest.mark.parametrize(
+    "array_func",
+    [
+        periodic_table_period_array,
+        periodic_table_group_array,
+        periodic_table_block_array,
+        periodic_table_category_array,
+    ],
+)
+@pytest.mark.parametrize(
+    "atomic_numbers, exception",
+    [
+        ([1, 0], InvalidParticleError),
+        ([-1], InvalidParticleError),
+        ([119], InvalidParticleError),
+        ([1.0, 2.0], TypeError),
+        (["H"], TypeError),
+    ],
+)
+def test_periodic_table_array_functions_errors(array_func, atomic_numbers, exception):
+    """Test that the ``periodic_table_*_array`` functions raise
+    exceptions for inputs that are not atomic numbers."""
+    with pytest.raises(exception):
+        array_func(atomic_numbers)
+
+
 # The tables above do not include the function to be tested in order to
 # avoid cluttering up the code.  The following block of code prepends
 # the correct function to each list containing args, kwargs, and the
@@ -701,6 +777,18 @@ def test_known_common_stable_isotopes_len():
     )
 
 
+def test_known_isotopes_sorted_by_mass_number():
+    """Test that `known_isotopes` returns isotope symbols sorted by
+    atomic number and then by mass number."""
+    isotopes = known_isotopes()
+    assert all(isotope in _isotopes for isotope in isotopes)
+    keys = [
+        (_isotopes[isotope]["atomic number"], _isotopes[isotope]["mass number"])
+        for isotope in isotopes
+    ]
+    assert keys == sorted(keys)
+
+
 @pytest.mark.parametrize("func", [common_isotopes, stable_isotopes, known_isotopes])
 def test_known_common_stable_isotopes_error(func):
     """Test that `known_isotopes`, `common_isotopes`, and
@@ -711,6 +799,77 @@ def test_known_common_stable_isotopes_error(func):
         pytest.fail(f"{func} is not raising a ElementError for neutrons.")
 
 
+array_and_scalar_functions_table = [
+    (
+        atomic_number_array,
+        atomic_number,
+        list(_elements) + known_isotopes() + [26, "alpha", "Fe-56 3+", "oganesson"],
+    ),
+    (mass_number_array, mass_number, known_isotopes() + ["alpha", "Fe-56 3+"]),
+    (
+        standard_atomic_weight_array,
+        standard_atomic_weight,
+        ["H", "He", "Fe", "Pb", "U", 82, "lead", "Au 0+"],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "array_func, scalar_func, particles", array_and_scalar_functions_table
+)
+def test_array_functions_match_scalar_functions(array_func, scalar_func, particles):
+    """Test that the ``*_array`` functions give the same values as the
+    corresponding scalar functions."""
+    result = array_func(particles)
+    expected = u.Quantity([scalar_func(particle) for particle in particles])
+    assert len(result) == len(particles)
+    assert np.all(result == expected)
+
+
+@pytest.mark.parametrize(
+    "array_func, particles, exception, message",
+    [
+        (
+            atomic_number_array,
+            ["H", "grumblemuffins"],
+            InvalidParticleError,
+            "In atomic_number, element = 'grumblemuffins'",
+        ),
+        (
+            atomic_number_array,
+            ["H", "e-"],
+            InvalidElementError,
+            "element = 'e-' to atomic_number",
+        ),
+        (
+            mass_number_array,
+            ["Pb-208", "Pb"],
+            InvalidIsotopeError,
+            "isotope = 'Pb' to mass_number",
+        ),
+        (
+            standard_atomic_weight_array,
+            ["H", "D"],
+            ParticleError,
+            "The particle D does not meet",
+        ),
+        (atomic_number_array, "CO", TypeError, "to atomic_number_array must be"),
+        (mass_number_array, "D", TypeError, "to mass_number_array must be"),
+        (
+            standard_atomic_weight_array,
+            "H",
+            TypeError,
+            "to standard_atomic_weight_array must be",
+        ),
+    ],
+)
+def test_array_functions_errors(array_func, particles, exception, message):
+    """Test that the ``*_array`` functions raise the same exceptions as
+    the corresponding scalar functions."""
+    with pytest.raises(exception, match=message):
+        array_func(particles)
+
+
 def test_isotopic_abundance():
     """Test that `isotopic_abundance` returns the appropriate values or
     raises appropriate errors for various isotopes."""
@@ -730,6 +889,41 @@ def test_isotopic_abundance():
         isotopic_abundance("Og-2")
 
 
+@pytest.mark.parametrize(
+    "func, argname, argument",
+    [
+        (isotopic_abundance, "isotope", "Fe-56"),
+        (isotopic_abundance, "isotope", "Be-8"),
+        (is_stable, "particle", "Fe-56"),
+        (is_stable, "particle", "T"),
+    ],
+)
+def test_isotope_lookups_match_keyword_calls(func, argname, argument):
+    """
+    Test that `isotopic_abundance` and `is_stable` return the same
+    values for isotope symbols passed positionally, which are looked up
+    directly, as when passed by keyword.
+    """
+    assert func(argument) == func(**{argname: argument})
+
+
+@pytest.mark.parametrize(
+    "func, argument, exception, message",
+    [
+        (isotopic_abundance, "xx", InvalidParticleError, "In isotopic_abundance, "),
+        (isotopic_abundance, "Fe", InvalidIsotopeError, "to isotopic_abundance "),
+        (is_stable, "xx", InvalidParticleError, "In is_stable, "),
+    ],
+)
+def test_error_messages_name_public_function(func, argument, exception, message):
+    """
+    Test that errors raised while converting the argument to a particle
+    name the public function that was called.
+    """
+    with pytest.raises(exception, match=message):
+        func(argument)
+
+
 isotopic_abundance_elements = (
     atomic_number(atomic_numb) for atomic_numb in range(1, 119)
 )
@@ -1,3 +1,4 @@
+import collections
 import pytest
 
 from typing import List, Optional, Tuple, Union
@@ -9,8 +10,11 @@ from plasmapy.particles.exceptions import (
     InvalidIsotopeError,
     InvalidParticleError,
     ParticleError,
+    ParticleWarning,
 )
 
+from .. import decorators
+from ..atomic import electric_charge
 from ..decorators import particle_input
 from ..particle_class import Particle
 
@@ -686,3 +690,101 @@ def test_not_ion(particle):
             f"{repr(particle)} even though the annotated argument is named "
             "'ion'."
         )
+
+
+def test_particle_input_reuses_particles():
+    """
+    Test that `particle_input` caches the `Particle` created for
+    repeated calls with the same `str` or `int` input, while passing a
+    distinct instance to each call.
+    """
+    first = func_simple_noparens(1, "Fe-56 3+")
+    second = func_simple_noparens(1, "Fe-56 3+")
+    assert first == second
+    assert first is not second
+    assert "Fe-56 3+" in decorators._particle_cache
+    assert func_simple_noparens(1, 26) == func_simple_noparens(1, 26)
+    assert 26 in decorators._particle_cache
+
+
+@pytest.mark.parametrize(
+    "args, kwargs",
+    [
+        (("Fe-56 3-",), {}),
+        (("Fe-56",), {"mass_numb": 56}),
+        (("Fe 3+",), {"Z": 3}),
+    ],
+)
+def test_particle_input_repeated_warnings(args, kwargs):
+    """
+    Test that `particle_input` continues to issue warnings from the
+    creation of a `Particle` when a function is called repeatedly with
+    the same arguments.
+    """
+    for _ in range(2):
+        with pytest.warns(ParticleWarning):
+            func_simple_noparens(1, *args, **kwargs)
+
+
+def test_particle_input_cache_evicts_least_recently_used(monkeypatch):
+    """
+    Test that the cache of `Particle` objects used by `particle_input`
+    evicts the least recently used entry once it is full.
+    """
+    monkeypatch.setattr(decorators, "_particle_cache", collections.OrderedDict())
+    monkeypatch.setattr(decorators, "_particle_cache_maxsize", 2)
+    func_simple_noparens(1, "H")
+    func_simple_noparens(1, "He")
+    func_simple_noparens(1, "H")
+    func_simple_noparens(1, "Li")
+    assert list(decorators._particle_cache) == ["H", "Li"]
+
+
+def test_particle_input_shared_charge_not_mutated():
+    """
+    Test that modifying the charge returned for a cached `Particle` in
+    place does not change the result of later calls.
+    """
+    expected = electric_charge("Fe 3+")
+    charge = electric_charge("Fe 3+")
+    charge *= 2
+    assert electric_charge("Fe 3+") == expected
+
+
+def test_particle_input_shared_categories_not_mutated():
+    """
+    Test that the categories of a cached `Particle` cannot be modified.
+    """
+    particle = func_simple_noparens(1, "Fe 3+")
+    with pytest.raises(AttributeError):
+        particle.categories.add("x")
+    assert "x" not in func_simple_noparens(1, "Fe 3+").categories
+
+
+def test_particle_input_shared_periodic_table_not_mutated():
+    """
+    Test that the periodic table information of a cached `Particle`
+    cannot be modified.
+    """
+    particle = func_simple_noparens(1, "Fe 3+")
+    with pytest.raises(AttributeError):
+        particle.periodic_table.group = 99
+    assert func_simple_noparens(1, "Fe 3+").periodic_table.group == 8
+
+
+@pytest.mark.parametrize("method", ["ionize", "recombine"])
+def test_particle_input_shared_particle_not_modified_in_place(method):
+    """
+    Test that ionizing or recombining the particle passed to a function
+    decorated with `particle_input` in place does not change the result
+    of later calls.
+    """
+
+    @particle_input
+    def modify_in_place(particle: Particle):
+        getattr(particle, method)(inplace=True)
+        return particle.charge_number
+
+    assert modify_in_place("He 1+") == (2 if method == "ionize" else 0)
+    assert func_simple_noparens(1, "He 1+").charge_number == 1
+    assert modify_in_place("He 1+") == (2 if method == "ionize" else 0)
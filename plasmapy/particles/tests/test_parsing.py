@@ -308,6 +308,7 @@ invalid_particles_table = [
     ("He-4", {"mass_numb": 3}),
     ("He 1+", {"mass_numb": 99}),
     ("He-99", {}),
+    ("Fe-5-6", {}),
     ("H-2+", {"Z": 0}),
     ("H-", {"Z": 1}),
     ("C VX", {}),
@@ -702,6 +702,19 @@ def test_particle_class_mass_nuclide_mass(isotope: str, ion: str):
         )
 
 
+@pytest.mark.parametrize("particle", ["e-", "Fe-56 3+", "He", "D"])
+def test_particle_mass_is_not_modified_in_place(particle):
+    """
+    Test that in-place operations on the ``mass`` attribute of a
+    `Particle` do not change the mass returned by later calls.
+    """
+    particle = Particle(particle)
+    expected_mass = particle.mass.copy()
+    mass = particle.mass
+    mass *= 2
+    assert particle.mass == expected_mass
+
+
 @pytest.mark.slow
 def test_particle_half_life_string():
     """